@@ -31,9 +31,11 @@ def process_data(data):
 @regrest(tolerance=1e-10)
 def calculate_pi():
     """Calculate pi approximation with high precision."""
-    pi = 0
+    pi = 0.0
+    sign = 1.0
     for i in range(1000000):
-        pi += ((-1) ** i) / (2 * i + 1)
+        pi += sign / (2 * i + 1)
+        sign = -sign
     return 4 * pi
 
 
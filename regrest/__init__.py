@@ -1,12 +1,6 @@
 """Regrest - Regression testing tool for Python."""
 
-try:
-    from importlib.metadata import version
-
-    __version__ = version("regrest")
-except Exception:
-    # Fallback for development mode or if package is not installed
-    __version__ = "unknown"
+from typing import Any
 
 from .config import Config, get_config, set_config
 from .decorator import regrest
@@ -28,3 +22,24 @@ __all__ = [
     "Matcher",
     "MatchResult",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve __version__ lazily on first access.
+
+    importlib.metadata is slow to import and is only needed for the version,
+    so it is not loaded on ``import regrest``.
+    """
+    if name == "__version__":
+        try:
+            from importlib.metadata import version
+
+            __version__ = version("regrest")
+        except Exception:
+            # Fallback for development mode or if package is not installed
+            __version__ = "unknown"
+
+        globals()["__version__"] = __version__
+        return __version__
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,39 @@
+"""JSON encoding for regrest.
+
+Uses orjson if installed, falling back to the standard library json module.
+"""
+
+import json
+from typing import Any
+
+# Try to import orjson
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: If True, indent the output with 2 spaces
+
+    Returns:
+        JSON bytes
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # orjson rejects some values the json module accepts (e.g.,
+            # integers wider than 64 bits), so fall back for those
+            pass
+
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
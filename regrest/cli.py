@@ -1,6 +1,14 @@
 """Command-line interface for regrest."""
 
-from typing import Annotated, Any, Optional
+import importlib
+import itertools
+import os
+import reprlib
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from operator import attrgetter
+from types import ModuleType
+from typing import Annotated, Any, Callable, Optional
 
 import typer
 
@@ -49,28 +57,17 @@ def list(
     _setup_config(storage_dir)
 
     storage = Storage()
-    records = storage.list_all()
 
-    if not records:
-        typer.echo("No test records found.")
-        return
-
-    # Filter records by keyword
-    if k:
-        keyword_lower = k.lower()
-        records = [
-            r
-            for r in records
-            if keyword_lower in r.module.lower() or keyword_lower in r.function.lower()
-        ]
+    # Load records matching the keyword, sorted by module, function, timestamp
+    records = sorted(storage.iter_all(keyword=k), key=_record_sort_key)
 
     if not records:
-        typer.echo("No test records found matching the filter.")
+        if k:
+            typer.echo("No test records found matching the filter.")
+        else:
+            typer.echo("No test records found.")
         return
 
-    # Sort by module, function, timestamp
-    records.sort(key=lambda r: (r.module, r.function, r.timestamp))
-
     typer.echo(f"Found {len(records)} test record(s):\n")
 
     current_module = None
@@ -187,6 +184,12 @@ def verify(
         Optional[float],
         typer.Option("--tolerance", help="Float comparison tolerance"),
     ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "-j", "--jobs", min=1, help="Number of worker processes to run functions"
+        ),
+    ] = 1,
 ) -> None:
     """Verify all recorded test records by re-executing functions.
 
@@ -200,33 +203,23 @@ def verify(
         regrest verify                      # Verify all records
         regrest verify -k calculate         # Verify only 'calculate' functions
         regrest verify --tolerance 0.001    # Custom float tolerance
+        regrest verify -j 4                 # Run functions in 4 processes
     """
     storage_dir = ctx.obj["storage_dir"]
     _setup_config(storage_dir)
 
     storage = Storage()
-    records = storage.list_all()
 
-    if not records:
-        typer.echo("No test records found.")
-        return
-
-    # Filter records by keyword
-    if k:
-        keyword_lower = k.lower()
-        records = [
-            r
-            for r in records
-            if keyword_lower in r.module.lower() or keyword_lower in r.function.lower()
-        ]
+    # Load records matching the keyword, sorted by module, function, timestamp
+    records = sorted(storage.iter_all(keyword=k), key=_record_sort_key)
 
     if not records:
-        typer.echo("No test records found matching the filter.")
+        if k:
+            typer.echo("No test records found matching the filter.")
+        else:
+            typer.echo("No test records found.")
         return
 
-    # Sort by module, function, timestamp
-    records.sort(key=lambda r: (r.module, r.function, r.timestamp))
-
     typer.echo(f"Verifying {len(records)} test record(s)...\n")
 
     passed = 0
@@ -235,9 +228,6 @@ def verify(
     failed_records = []
 
     # Import necessary modules
-    import importlib
-    import os
-    import sys
     from .matcher import Matcher
 
     # Add current working directory to sys.path to allow importing user modules
@@ -247,55 +237,71 @@ def verify(
 
     matcher = Matcher(tolerance=tolerance)
 
-    current_module = None
-    for record in records:
-        # Print module header if changed
-        if record.module != current_module:
-            if current_module is not None:
-                typer.echo()
-            typer.secho(f"{record.module}:", fg=typer.colors.CYAN, bold=True)
-            current_module = record.module
+    # Records are grouped by module and function, so resolve each only once
+    module_cache: dict[str, ModuleType] = {}
+    function_cache: dict[tuple[str, str], Callable] = {}
+
+    # Run functions in worker processes if requested. Results are collected
+    # in record order, so the output is the same as in the serial case.
+    executor: Optional[ProcessPoolExecutor] = None
+    futures: dict[int, Future] = {}
+    if jobs > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(cwd,)
+        )
+        for i, record in enumerate(records):
+            futures[i] = executor.submit(
+                _execute_record,
+                record.module,
+                record.function,
+                record.args,
+                record.kwargs,
+            )
 
-        # Print function being tested
-        typer.echo(f"  {record.function}() [ID: {record.record_id[:8]}]...", nl=False)
+    try:
+        current_module = None
+        for i, record in enumerate(records):
+            # Print module header if changed
+            if record.module != current_module:
+                if current_module is not None:
+                    typer.echo()
+                typer.secho(f"{record.module}:", fg=typer.colors.CYAN, bold=True)
+                current_module = record.module
+
+            # Print function being tested
+            typer.echo(
+                f"  {record.function}() [ID: {record.record_id[:8]}]...", nl=False
+            )
 
-        try:
-            # Import module and get function
             try:
-                module = importlib.import_module(record.module)
-            except ImportError as e:
-                raise ImportError(
-                    f"Cannot import module '{record.module}'. "
-                    f"Make sure to run this command from the project root directory. "
-                    f"Original error: {str(e)}"
-                )
-
-            func = getattr(module, record.function)
-
-            # Get the original function if it's decorated
-            if hasattr(func, "__wrapped__"):
-                original_func = func.__wrapped__
-            else:
-                original_func = func
-
-            # Execute function with recorded arguments
-            result = original_func(*record.args, **record.kwargs)
-
-            # Compare result with recorded value
-            match_result = matcher.match(record.result, result)
-
-            if match_result:
-                typer.secho(" PASS", fg=typer.colors.GREEN)
-                passed += 1
-            else:
-                typer.secho(" FAIL", fg=typer.colors.RED)
-                failed += 1
-                failed_records.append((record, match_result.message))
-
-        except Exception as e:
-            typer.secho(" ERROR", fg=typer.colors.RED)
-            errors += 1
-            failed_records.append((record, f"Exception: {str(e)}"))
+                if executor is not None:
+                    result = futures[i].result()
+                else:
+                    original_func = _resolve_function(
+                        record.module, record.function, module_cache, function_cache
+                    )
+
+                    # Execute function with recorded arguments
+                    result = original_func(*record.args, **record.kwargs)
+
+                # Compare result with recorded value
+                match_result = matcher.match(record.result, result)
+
+                if match_result:
+                    typer.secho(" PASS", fg=typer.colors.GREEN)
+                    passed += 1
+                else:
+                    typer.secho(" FAIL", fg=typer.colors.RED)
+                    failed += 1
+                    failed_records.append((record, match_result.message))
+
+            except Exception as e:
+                typer.secho(" ERROR", fg=typer.colors.RED)
+                errors += 1
+                failed_records.append((record, f"Exception: {str(e)}"))
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
     # Summary
     typer.echo()
@@ -317,7 +323,9 @@ def verify(
         typer.secho("Failed Records:", fg=typer.colors.RED, bold=True)
         for record, error_msg in failed_records:
             typer.echo()
-            typer.echo(f"  {record.module}.{record.function}() [ID: {record.record_id[:8]}]")
+            typer.echo(
+                f"  {record.module}.{record.function}() [ID: {record.record_id[:8]}]"
+            )
             typer.echo(f"    {error_msg}")
 
     # Exit with error code if any tests failed
@@ -354,6 +362,90 @@ def serve(
     run_server(host=host, port=port, storage_dir=storage_dir, reload=reload)
 
 
+def _resolve_function(
+    module_name: str,
+    function_name: str,
+    module_cache: dict[str, ModuleType],
+    function_cache: dict[tuple[str, str], Callable],
+) -> Callable:
+    """Import a recorded function, unwrapping the @regrest decorator.
+
+    Args:
+        module_name: Module name where the function is defined
+        function_name: Function name
+        module_cache: Cache of imported modules by name
+        function_cache: Cache of resolved functions by (module, function)
+
+    Returns:
+        The original (undecorated) function
+
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the function is not found in the module
+    """
+    key = (module_name, function_name)
+    if key in function_cache:
+        return function_cache[key]
+
+    # Import module and get function
+    if module_name not in module_cache:
+        try:
+            module_cache[module_name] = importlib.import_module(module_name)
+        except ImportError as e:
+            raise ImportError(
+                f"Cannot import module '{module_name}'. "
+                f"Make sure to run this command from the project root directory. "
+                f"Original error: {str(e)}"
+            ) from e
+
+    func = getattr(module_cache[module_name], function_name)
+
+    # Get the original function if it's decorated
+    original_func = getattr(func, "__wrapped__", func)
+
+    function_cache[key] = original_func
+    return original_func
+
+
+# Per-process caches used by verify worker processes
+_worker_module_cache: dict[str, ModuleType] = {}
+_worker_function_cache: dict[tuple[str, str], Callable] = {}
+
+
+def _init_worker(cwd: str) -> None:
+    """Initialize a verify worker process.
+
+    Args:
+        cwd: Working directory to add to sys.path for importing user modules
+    """
+    if cwd not in sys.path:
+        sys.path.insert(0, cwd)
+
+
+def _execute_record(
+    module_name: str, function_name: str, args: tuple, kwargs: dict
+) -> Any:
+    """Execute a recorded function in a verify worker process.
+
+    Args:
+        module_name: Module name where the function is defined
+        function_name: Function name
+        args: Recorded positional arguments
+        kwargs: Recorded keyword arguments
+
+    Returns:
+        Return value of the function
+    """
+    func = _resolve_function(
+        module_name, function_name, _worker_module_cache, _worker_function_cache
+    )
+    return func(*args, **kwargs)
+
+
+# Sort key grouping records by module and function, oldest first
+_record_sort_key = attrgetter("module", "function", "timestamp")
+
+
 def _setup_config(storage_dir: str) -> None:
     """Set up configuration.
 
@@ -364,6 +456,46 @@ def _setup_config(storage_dir: str) -> None:
     set_config(config)
 
 
+class _DisplayRepr(reprlib.Repr):
+    """Bounded repr for display.
+
+    Values are truncated to 80 characters anyway, so large containers and
+    strings are cut off early instead of being rendered in full. Long strings
+    keep their first 80 characters and other values are not elided, so
+    _format_value still shows a prefix followed by "...".
+    """
+
+    def __init__(self) -> None:
+        """Initialize limits."""
+        super().__init__()
+        self.maxtuple = self.maxlist = self.maxarray = 30
+        self.maxset = self.maxfrozenset = self.maxdeque = 30
+        self.maxdict = 15
+        self.maxstring = 80
+        self.maxlong = self.maxother = sys.maxsize
+
+    def repr_str(self, x: str, level: int) -> str:
+        """Represent a string, keeping only the start of long strings."""
+        return repr(x[: self.maxstring])
+
+    def repr_dict(self, x: dict, level: int) -> str:
+        """Represent a dict, keeping insertion order instead of sorting keys."""
+        if not x:
+            return "{}"
+        if level <= 0:
+            return "{...}"
+        pieces = [
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+            for key, value in itertools.islice(x.items(), self.maxdict)
+        ]
+        if len(x) > self.maxdict:
+            pieces.append("...")
+        return "{" + ", ".join(pieces) + "}"
+
+
+_display_repr = _DisplayRepr()
+
+
 def _format_value(value: Any) -> str:
     """Format a value for display.
 
@@ -373,7 +505,7 @@ def _format_value(value: Any) -> str:
     Returns:
         Formatted string
     """
-    value_str = repr(value)
+    value_str = _display_repr.repr(value)
     if len(value_str) > 80:
         value_str = value_str[:77] + "..."
     return value_str
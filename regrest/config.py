@@ -55,6 +55,8 @@ class Config:
         REGREST_UPDATE_MODE: If true, update records instead of testing
             (true/false, 1/0)
         REGREST_FLOAT_TOLERANCE: Float comparison tolerance (e.g., 1e-9)
+        REGREST_DISABLE: If true, @regrest returns functions undecorated
+            (true/false, 1/0)
     """
 
     def __init__(
@@ -63,6 +65,7 @@ class Config:
         raise_on_error: Optional[bool] = None,
         update_mode: Optional[bool] = None,
         float_tolerance: Optional[float] = None,
+        disabled: Optional[bool] = None,
     ):
         """Initialize configuration.
 
@@ -71,6 +74,7 @@ class Config:
             raise_on_error: If True, raise exception on test failure
             update_mode: If True, update records instead of testing
             float_tolerance: Float comparison tolerance
+            disabled: If True, @regrest returns functions undecorated
         """
         # Storage directory: argument > env > default
         if storage_dir is not None:
@@ -97,6 +101,12 @@ class Config:
         else:
             self.float_tolerance = _get_env_float("REGREST_FLOAT_TOLERANCE", 1e-9)
 
+        # disabled: argument > env > default (False)
+        if disabled is not None:
+            self.disabled = disabled
+        else:
+            self.disabled = _get_env_bool("REGREST_DISABLE", False)
+
     def ensure_storage_dir(self) -> None:
         """Create storage directory if it doesn't exist.
 
@@ -4,6 +4,7 @@ import functools
 import logging
 import os
 import sys
+from pathlib import Path
 from typing import Any, Callable, Optional
 
 from ._logging import regrest_logger
@@ -13,6 +14,37 @@ from .matcher import Matcher
 from .storage import Storage, TestRecord
 
 
+@functools.lru_cache(maxsize=4)
+def _get_storage(storage_dir: Path) -> Storage:
+    """Get a shared storage instance for the given storage directory.
+
+    The storage directory is only used as the cache key; the instance itself
+    is created from the current global configuration. Only a few instances
+    are kept, so storages of directories that are no longer used (e.g., one
+    per test) are released.
+
+    Args:
+        storage_dir: Directory to store test records
+
+    Returns:
+        Storage instance
+    """
+    return Storage()
+
+
+@functools.cache
+def _get_matcher(tolerance: float) -> Matcher:
+    """Get a shared matcher instance for the given tolerance.
+
+    Args:
+        tolerance: Float comparison tolerance
+
+    Returns:
+        Matcher instance
+    """
+    return Matcher(tolerance=tolerance)
+
+
 def regrest(
     func: Optional[Callable] = None,
     *,
@@ -51,14 +83,29 @@ def regrest(
         @regrest(raise_on_error=False)
         def maybe_failing():
             return some_value()
+
+    Note:
+        If regression testing is disabled (``REGREST_DISABLE=1``) when the
+        function is decorated, the function is returned undecorated.
     """
 
     def decorator(f: Callable) -> Callable:
-        @functools.wraps(f)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Get function metadata
+        # When disabled, return the function as is so calls pay no overhead.
+        # This is checked at decoration time, typically once at import.
+        if get_config().disabled:
+            return f
+
+        # Resolve function metadata once at decoration time
+        function = f.__name__
+        resolved_module: Optional[str] = None
+
+        def resolve_module() -> str:
+            """Resolve the module name, converting __main__ to the script name."""
+            nonlocal resolved_module
+            if resolved_module is not None:
+                return resolved_module
+
             module = f.__module__
-            function = f.__name__
 
             # Convert __main__ to actual script filename
             if module == "__main__":
@@ -74,8 +121,19 @@ def regrest(
                         if module not in sys.modules:
                             sys.modules[module] = main_module
 
+            resolved_module = module
+            return module
+
+        @functools.wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            module = resolve_module()
+
+            # Check the log level once per call; arguments and results are only
+            # formatted when debug logging is enabled
+            debug_enabled = regrest_logger.isEnabledFor(logging.DEBUG)
+
             # Debug logging: log function call with arguments
-            if regrest_logger.isEnabledFor(logging.DEBUG):
+            if debug_enabled:
                 regrest_logger.debug(
                     "Calling %s.%s with args=%s, kwargs=%s",
                     module,
@@ -91,15 +149,15 @@ def regrest(
                 raise_on_error if raise_on_error is not None else config.raise_on_error
             )
 
-            # Initialize storage and matcher
-            storage = Storage()
-            matcher = Matcher(tolerance=tolerance)
+            # Reuse storage and matcher across calls
+            storage = _get_storage(config.storage_dir)
+            matcher = _get_matcher(tolerance or config.float_tolerance)
 
             # Execute function
             result = f(*args, **kwargs)
 
             # Debug logging: log return value
-            if regrest_logger.isEnabledFor(logging.DEBUG):
+            if debug_enabled:
                 regrest_logger.debug(
                     "Function %s.%s returned: %s", module, function, result
                 )
@@ -140,12 +198,14 @@ def regrest(
                     kwargs=kwargs,
                     result=result,
                 )
-                storage.save(record)
+                written = storage.save(record)
 
                 if existing_record is None:
                     regrest_logger.info("Recorded: %s.%s", module, function)
-                else:
+                elif written:
                     regrest_logger.info("Updated: %s.%s", module, function)
+                else:
+                    regrest_logger.info("Unchanged: %s.%s", module, function)
             else:
                 # Test mode: compare with recorded result
                 match_result = matcher.match(existing_record.result, result)
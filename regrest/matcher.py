@@ -5,6 +5,9 @@ from typing import Any, Optional
 
 from .config import get_config
 
+# Types for which equality implies a match, so no further comparison is needed
+_EQUALITY_TYPES = frozenset({bool, int, float, str, bytes})
+
 
 class MatchResult:
     """Result of a match operation."""
@@ -46,6 +49,10 @@ class Matcher:
         Returns:
             MatchResult indicating whether values match
         """
+        # Fast path: identical objects always match
+        if expected is actual:
+            return MatchResult(True)
+
         # Type check
         if type(expected) is not type(actual):
             return MatchResult(
@@ -55,6 +62,10 @@ class Matcher:
                 f"got {type(actual).__name__}",
             )
 
+        # Fast path: equal scalars match without tolerance checks
+        if type(expected) in _EQUALITY_TYPES and expected == actual:
+            return MatchResult(True)
+
         # None (actual is also None due to type check above)
         if expected is None:
             return MatchResult(True)
@@ -3,27 +3,67 @@
 Supports both Flask (if installed) and standard library HTTP server.
 """
 
+import gzip
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import threading
 import time
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
-from typing import Any, Optional, Union
-from urllib.parse import urlparse
+from typing import Any, Callable, Optional, Union
+from urllib.parse import parse_qs, urlparse
 
+from . import _json
 from .storage import Storage, TestRecord
 
 # Try to import Flask
 try:
-    from flask import Flask, jsonify, send_from_directory
+    from flask import Flask, Response, request, send_from_directory
 
     HAS_FLASK = True
 except ImportError:
     HAS_FLASK = False
 
+# Try to import waitress (production WSGI server for the Flask app)
+try:
+    from waitress import serve as waitress_serve
+
+    HAS_WAITRESS = True
+except ImportError:
+    HAS_WAITRESS = False
+
+# Try to import watchfiles (file change notifications for hot reload)
+try:
+    from watchfiles import watch
+
+    HAS_WATCHFILES = True
+except ImportError:
+    HAS_WATCHFILES = False
+
+# Directory of the web UI files
+_STATIC_DIR = Path(__file__).parent / "static"
+_STATIC_DIR_STR = str(_STATIC_DIR)
+
+# Content types of the web UI files, by extension
+_CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".json": "application/json",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".ico": "image/x-icon",
+}
+
+# Pattern of the error raised when a pickled class no longer exists
+_CLASS_NOT_FOUND_RE = re.compile(r"Class '(\w+)' not found")
+
 
 # ============================================================================
 # Flask-based server (if Flask is available)
@@ -52,196 +92,40 @@ def _create_flask_app(storage_dir: str) -> Any:
     app = Flask(__name__)
     app.config["storage"] = storage
 
+    # Record API shared with the standard library server
+    api = _RecordsApi(storage)
+
     @app.route("/")
     def index() -> Any:
         """Serve index.html."""
-        static_dir = Path(__file__).parent / "static"
-        return send_from_directory(static_dir, "index.html")
+        return send_from_directory(_STATIC_DIR, "index.html")
 
     @app.route("/static/<path:filename>")
     def static_files(filename: str) -> Any:
         """Serve static files (CSS, JS, images)."""
-        static_dir = Path(__file__).parent / "static"
-        return send_from_directory(static_dir, filename)
+        return send_from_directory(_STATIC_DIR, filename)
 
     @app.route("/api/records", methods=["GET"])
     def get_records() -> Any:
-        """Get all records as JSON."""
-        try:
-            # Get all record files
-            record_files = list(storage.config.storage_dir.glob("*.json"))
-
-            records_data = []
-            error_records = []
-
-            for filepath in record_files:
-                try:
-                    # Read the JSON file to get basic info
-                    with open(filepath, encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    # Try to load the full record
-                    record = TestRecord.from_dict(data)
-
-                    record_dict = {
-                        "module": record.module,
-                        "function": record.function,
-                        "args": _serialize_value(record.args),
-                        "kwargs": _serialize_value(record.kwargs),
-                        "result": _serialize_value(record.result),
-                        "timestamp": record.timestamp,
-                        "record_id": record.record_id,
-                    }
-                    records_data.append(record_dict)
-
-                except AttributeError as e:
-                    # Class not found error - extract useful information
-                    error_msg = str(e)
-                    match = re.search(r"Class '(\w+)' not found", error_msg)
-                    class_name = match.group(1) if match else "Unknown"
-
-                    error_records.append(
-                        {
-                            "record_id": data.get("record_id", filepath.stem),
-                            "module": data.get("module", "unknown"),
-                            "function": data.get("function", "unknown"),
-                            "timestamp": data.get("timestamp", ""),
-                            "error_type": "MissingClass",
-                            "error_message": (
-                                f"Class '{class_name}' not found in module"
-                            ),
-                            "details": (
-                                f"The class '{class_name}' has been deleted or renamed."
-                            ),
-                            "suggested_fixes": [
-                                f"Restore the '{class_name}' class",
-                                "Delete this record",
-                                "Update all records with REGREST_UPDATE_MODE=1",
-                            ],
-                        }
-                    )
-
-                except Exception as e:
-                    # Generic error
-                    has_data = "data" in locals()
-                    error_records.append(
-                        {
-                            "record_id": (
-                                data.get("record_id", filepath.stem)
-                                if has_data
-                                else filepath.stem
-                            ),
-                            "module": (
-                                data.get("module", "unknown") if has_data else "unknown"
-                            ),
-                            "function": (
-                                data.get("function", "unknown")
-                                if has_data
-                                else "unknown"
-                            ),
-                            "timestamp": (
-                                data.get("timestamp", "") if has_data else ""
-                            ),
-                            "error_type": type(e).__name__,
-                            "error_message": str(e)[:200],
-                            "details": "Failed to load this record",
-                            "suggested_fixes": [
-                                "Delete this record",
-                                "Check the record file for corruption",
-                            ],
-                        }
-                    )
-
-            # Sort by timestamp (newest first)
-            records_data.sort(key=lambda r: r["timestamp"], reverse=True)
-
-            response: Union[dict[str, Any], list[dict[str, Any]]] = {
-                "records": records_data,
-                "error_records": error_records,
-                "total_errors": len(error_records),
-            }
-
-            # For backward compatibility, return just the array if no errors
-            if len(error_records) == 0:
-                response = records_data
-
-            return jsonify(response)
-
-        except Exception as e:
-            return jsonify({"error": f"Error loading records: {str(e)}"}), 500
+        """Get records as JSON."""
+        accept_encoding = request.headers.get("Accept-Encoding")
+        return _flask_api_response(api.get_records(request.args, accept_encoding))
 
     @app.route("/api/stats", methods=["GET"])
     def get_stats() -> Any:
         """Get statistics as JSON."""
-        try:
-            records = storage.list_all()
-
-            # Calculate statistics
-            total_records = len(records)
-            modules = {r.module for r in records}
-            functions = {f"{r.module}.{r.function}" for r in records}
-
-            # Group by module and function
-            by_module: dict[str, int] = {}
-            by_function: dict[str, int] = {}
-
-            for record in records:
-                # By module
-                if record.module not in by_module:
-                    by_module[record.module] = 0
-                by_module[record.module] += 1
-
-                # By function
-                func_key = f"{record.module}.{record.function}"
-                if func_key not in by_function:
-                    by_function[func_key] = 0
-                by_function[func_key] += 1
-
-            stats = {
-                "total_records": total_records,
-                "total_modules": len(modules),
-                "total_functions": len(functions),
-                "by_module": by_module,
-                "by_function": by_function,
-            }
-
-            return jsonify(stats)
-
-        except Exception as e:
-            return jsonify({"error": f"Error calculating stats: {str(e)}"}), 500
+        accept_encoding = request.headers.get("Accept-Encoding")
+        return _flask_api_response(api.get_stats(request.args, accept_encoding))
 
     @app.route("/api/records/<record_id>", methods=["DELETE"])
     def delete_record(record_id: str) -> Any:
         """Delete a single record."""
-        try:
-            success = storage.delete(record_id)
-
-            if success:
-                return jsonify(
-                    {"success": True, "message": f"Deleted record {record_id}"}
-                )
-            else:
-                return jsonify({"error": f"Record {record_id} not found"}), 404
-
-        except Exception as e:
-            return jsonify({"error": f"Error deleting record: {str(e)}"}), 500
+        return _flask_api_response(api.delete_record(record_id))
 
     @app.route("/api/records", methods=["DELETE"])
     def delete_all_records() -> Any:
         """Delete all records."""
-        try:
-            count = storage.clear_all()
-
-            return jsonify(
-                {
-                    "success": True,
-                    "count": count,
-                    "message": f"Deleted {count} records",
-                }
-            )
-
-        except Exception as e:
-            return jsonify({"error": f"Error deleting records: {str(e)}"}), 500
+        return _flask_api_response(api.delete_all_records())
 
     return app
 
@@ -254,19 +138,18 @@ def _create_flask_app(storage_dir: str) -> Any:
 class RecordHandler(BaseHTTPRequestHandler):
     """HTTP request handler for test records visualization."""
 
-    storage: Optional[Storage] = None
+    api: Optional["_RecordsApi"] = None
 
     def do_GET(self) -> None:
         """Handle GET requests."""
         parsed_path = urlparse(self.path)
         path = parsed_path.path
+        query = {k: v[0] for k, v in parse_qs(parsed_path.query).items()}
 
         if path == "/":
             self._serve_static_file("index.html")
-        elif path == "/api/records":
-            self._serve_records_api()
-        elif path == "/api/stats":
-            self._serve_stats_api()
+        elif path in ("/api/records", "/api/stats"):
+            self._serve_api(path, query)
         else:
             self._serve_404()
 
@@ -275,366 +158,966 @@ class RecordHandler(BaseHTTPRequestHandler):
         parsed_path = urlparse(self.path)
         path = parsed_path.path
 
-        if path == "/api/records":
-            self._delete_all_records()
-        elif path.startswith("/api/records/"):
-            record_id = path.split("/")[-1]
-            self._delete_record(record_id)
+        if path == "/api/records" or path.startswith("/api/records/"):
+            self._serve_api(path)
         else:
             self._serve_404()
 
     def _serve_static_file(self, filename: str) -> None:
-        """Serve static files."""
+        """Serve static files.
+
+        Responses carry an ETag so that browsers can revalidate with
+        If-None-Match and get a 304 without a body.
+        """
         try:
-            static_dir = Path(__file__).parent / "static"
-            file_path = static_dir / filename
+            file_path = os.path.join(_STATIC_DIR_STR, filename)
 
-            if not file_path.exists():
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
                 self._serve_404()
                 return
 
+            etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
             with open(file_path, "rb") as f:
-                content = f.read()
-
-            self.send_response(200)
-            if filename.endswith(".html"):
-                self.send_header("Content-type", "text/html; charset=utf-8")
-            elif filename.endswith(".css"):
-                self.send_header("Content-type", "text/css")
-            elif filename.endswith(".js"):
-                self.send_header("Content-type", "application/javascript")
-            self.end_headers()
-            self.wfile.write(content)
+                content_type = _CONTENT_TYPES.get(
+                    os.path.splitext(filename)[1], "application/octet-stream"
+                )
+                self.send_response(200)
+                self.send_header("Content-type", content_type)
+                self.send_header("Content-Length", str(stat.st_size))
+                # Filenames are not content-hashed, so always revalidate
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("ETag", etag)
+                self.end_headers()
+                shutil.copyfileobj(f, self.wfile)
 
         except Exception as e:
             self._serve_error(500, f"Error serving file: {str(e)}")
 
-    def _serve_records_api(self) -> None:
-        """Serve records as JSON API."""
-        if not self.storage:
+    def _serve_api(self, path: str, query: Optional[dict[str, str]] = None) -> None:
+        """Serve a JSON API request.
+
+        Args:
+            path: Request path
+            query: Query parameters (GET requests only)
+        """
+        if not self.api:
             self._serve_error(500, "Storage not initialized")
             return
 
-        try:
-            # Get all record files
-            record_files = list(self.storage.config.storage_dir.glob("*.json"))
-
-            records_data = []
-            error_records = []
-
-            for filepath in record_files:
-                try:
-                    # Read the JSON file to get basic info
-                    with open(filepath, encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    # Try to load the full record
-                    record = TestRecord.from_dict(data)
-
-                    record_dict = {
-                        "module": record.module,
-                        "function": record.function,
-                        "args": self._serialize_value(record.args),
-                        "kwargs": self._serialize_value(record.kwargs),
-                        "result": self._serialize_value(record.result),
-                        "timestamp": record.timestamp,
-                        "record_id": record.record_id,
-                    }
-                    records_data.append(record_dict)
-
-                except AttributeError as e:
-                    # Class not found error - extract useful information
-                    error_msg = str(e)
-                    # Extract class name from error message
-                    match = re.search(r"Class '(\w+)' not found", error_msg)
-                    class_name = match.group(1) if match else "Unknown"
-
-                    error_records.append(
-                        {
-                            "record_id": data.get("record_id", filepath.stem),
-                            "module": data.get("module", "unknown"),
-                            "function": data.get("function", "unknown"),
-                            "timestamp": data.get("timestamp", ""),
-                            "error_type": "MissingClass",
-                            "error_message": (
-                                f"Class '{class_name}' not found in module"
-                            ),
-                            "details": (
-                                f"The class '{class_name}' has been deleted or renamed."
-                            ),
-                            "suggested_fixes": [
-                                f"Restore the '{class_name}' class",
-                                "Delete this record",
-                                "Update all records with REGREST_UPDATE_MODE=1",
-                            ],
-                        }
-                    )
-
-                except Exception as e:
-                    # Generic error
-                    has_data = "data" in locals()
-                    error_records.append(
-                        {
-                            "record_id": (
-                                data.get("record_id", filepath.stem)
-                                if has_data
-                                else filepath.stem
-                            ),
-                            "module": (
-                                data.get("module", "unknown") if has_data else "unknown"
-                            ),
-                            "function": (
-                                data.get("function", "unknown")
-                                if has_data
-                                else "unknown"
-                            ),
-                            "timestamp": (
-                                data.get("timestamp", "") if has_data else ""
-                            ),
-                            "error_type": type(e).__name__,
-                            "error_message": str(e)[:200],
-                            "details": "Failed to load this record",
-                            "suggested_fixes": [
-                                "Delete this record",
-                                "Check the record file for corruption",
-                            ],
-                        }
-                    )
-
-            # Sort by timestamp (newest first)
-            records_data.sort(key=lambda r: r["timestamp"], reverse=True)
-
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
+        accept_encoding = self.headers.get("Accept-Encoding")
+        if query is None:
+            if path == "/api/records":
+                response = self.api.delete_all_records()
+            else:
+                response = self.api.delete_record(path.split("/")[-1])
+        elif path == "/api/records":
+            response = self.api.get_records(query, accept_encoding)
+        else:
+            response = self.api.get_stats(query, accept_encoding)
+
+        status, body, headers = response
+        self._send_json_body(status, body, headers, cors=status < 400)
+
+    def _send_json(
+        self, code: int, obj: Any, indent: bool = False, cors: bool = True
+    ) -> None:
+        """Send a JSON response.
+
+        Args:
+            code: HTTP status code
+            obj: Object to serialize
+            indent: If True, indent the JSON output
+            cors: If True, allow cross-origin requests
+        """
+        self._send_json_body(code, _json.dumps(obj, indent=indent), cors=cors)
+
+    def _send_json_body(
+        self,
+        code: int,
+        body: bytes,
+        headers: Optional[dict[str, str]] = None,
+        cors: bool = True,
+    ) -> None:
+        """Send an already encoded JSON response.
+
+        Args:
+            code: HTTP status code
+            body: Encoded JSON
+            headers: Extra response headers
+            cors: If True, allow cross-origin requests
+        """
+        self.send_response(code)
+        self.send_header("Content-type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if cors:
             self.send_header("Access-Control-Allow-Origin", "*")
-            self.end_headers()
+            # Let cross-origin clients read the pagination header
+            self.send_header("Access-Control-Expose-Headers", "X-Total-Count")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
 
-            response: Union[dict[str, Any], list[dict[str, Any]]] = {
-                "records": records_data,
-                "error_records": error_records,
-                "total_errors": len(error_records),
-            }
+    def _serve_404(self) -> None:
+        """Serve 404 error."""
+        self.send_response(404)
+        self.send_header("Content-type", "text/html")
+        self.end_headers()
+        html = "<html><body><h1>404 Not Found</h1></body></html>"
+        self.wfile.write(html.encode("utf-8"))
 
-            # For backward compatibility, return just the array if no errors
-            if len(error_records) == 0:
-                response = records_data
+    def _serve_error(self, code: int, message: str) -> None:
+        """Serve error response."""
+        self._send_json(code, {"error": message}, cors=False)
 
-            self.wfile.write(json.dumps(response, indent=2).encode("utf-8"))
+    def log_message(self, format: str, *args: Any) -> None:
+        """Override to customize logging."""
+        # Simple log format
+        print(f"[{self.log_date_time_string()}] {format % args}")
 
-        except Exception as e:
-            self._serve_error(500, f"Error loading records: {str(e)}")
 
-    def _serve_stats_api(self) -> None:
-        """Serve statistics as JSON API."""
-        if not self.storage:
-            self._serve_error(500, "Storage not initialized")
-            return
+# ============================================================================
+# Shared helper function
+# ============================================================================
 
-        try:
-            records = self.storage.list_all()
-
-            # Calculate statistics
-            total_records = len(records)
-            modules = {r.module for r in records}
-            functions = {f"{r.module}.{r.function}" for r in records}
-
-            # Group by module and function
-            by_module = {}
-            by_function = {}
-
-            for record in records:
-                # By module
-                if record.module not in by_module:
-                    by_module[record.module] = 0
-                by_module[record.module] += 1
-
-                # By function
-                func_key = f"{record.module}.{record.function}"
-                if func_key not in by_function:
-                    by_function[func_key] = 0
-                by_function[func_key] += 1
-
-            stats = {
-                "total_records": total_records,
-                "total_modules": len(modules),
-                "total_functions": len(functions),
-                "by_module": by_module,
-                "by_function": by_function,
-            }
+# Maximum number of records kept by the records API cache
+_RECORD_CACHE_SIZE = 4096
 
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.send_header("Access-Control-Allow-Origin", "*")
-            self.end_headers()
-            self.wfile.write(json.dumps(stats, indent=2).encode("utf-8"))
+# Records API entries keyed by file path, validated against (mtime_ns, size)
+_record_cache: dict[str, tuple[int, int, dict[str, Any]]] = {}
+_record_cache_lock = threading.Lock()
 
-        except Exception as e:
-            self._serve_error(500, f"Error calculating stats: {str(e)}")
+# Seconds a cached API response stays valid
+_RESPONSE_CACHE_TTL = 5.0
 
-    def _serialize_value(self, value: Any, depth: int = 0, max_depth: int = 10) -> Any:
-        """Serialize a value for JSON response.
+# Maximum number of cached API responses (one per distinct query)
+_RESPONSE_CACHE_SIZE = 64
+
+# Minimum body size worth compressing, and the gzip level to use
+_GZIP_MIN_SIZE = 1024
+_GZIP_LEVEL = 4
+
+# Cached API response: (encoded body, extra headers)
+_CachedResponse = tuple[bytes, dict[str, str]]
+
+
+class _ResponseCache:
+    """Short-lived cache of encoded API responses.
+
+    Entries are keyed by request name and storage directory, and are
+    invalidated when the directory's modification time changes or the TTL
+    expires. The TTL bounds staleness when an existing record file is
+    overwritten in place, which does not change the directory's mtime.
+    """
+
+    def __init__(self, ttl: float = _RESPONSE_CACHE_TTL):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a cached response stays valid
+        """
+        self.ttl = ttl
+        self._entries: dict[tuple[str, str], tuple[int, float, _CachedResponse]] = {}
+        # Guards _entries, which is shared by the server's request threads
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _version(storage_dir: Path) -> int:
+        """Get the version of the storage directory (its mtime)."""
+        try:
+            return storage_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return -1
+
+    def get(
+        self, name: str, storage_dir: Path
+    ) -> tuple[Optional[_CachedResponse], int]:
+        """Get a cached response.
 
         Args:
-            value: Value to serialize
-            depth: Current recursion depth
-            max_depth: Maximum recursion depth
+            name: Request name (endpoint and normalized query)
+            storage_dir: Directory containing test records
 
         Returns:
-            JSON-serializable value
+            Tuple of (cached (body, headers) or None, current directory
+            version). The version should be passed to put() when caching a
+            new response.
         """
-        # Prevent infinite recursion
-        if depth > max_depth:
-            return f"<max depth reached: {type(value).__name__}>"
+        version = self._version(storage_dir)
+        with self._lock:
+            entry = self._entries.get((name, str(storage_dir)))
+        if entry is not None:
+            cached_version, expires_at, response = entry
+            if cached_version == version and time.monotonic() < expires_at:
+                return response, version
+        return None, version
+
+    def put(
+        self,
+        name: str,
+        storage_dir: Path,
+        version: int,
+        body: bytes,
+        headers: Optional[dict[str, str]] = None,
+    ) -> None:
+        """Cache a response.
 
-        # Handle JSON-serializable primitives
-        if value is None or isinstance(value, (bool, int, float, str)):
-            return value
+        Args:
+            name: Request name (endpoint and normalized query)
+            storage_dir: Directory containing test records
+            version: Directory version returned by get()
+            body: Encoded response body
+            headers: Extra response headers
+        """
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if len(self._entries) >= _RESPONSE_CACHE_SIZE:
+                # Evict the oldest entry
+                self._entries.pop(next(iter(self._entries)), None)
+            self._entries[(name, str(storage_dir))] = (
+                version,
+                expires_at,
+                (body, headers or {}),
+            )
 
-        # Handle lists and tuples
-        if isinstance(value, (list, tuple)):
-            return [self._serialize_value(item, depth + 1, max_depth) for item in value]
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
 
-        # Handle dicts
-        if isinstance(value, dict):
-            return {
-                str(k): self._serialize_value(v, depth + 1, max_depth)
-                for k, v in value.items()
-            }
 
-        # Handle sets
-        if isinstance(value, set):
-            return list(value)
+def _iter_record_files(storage_dir: Path) -> Iterator[os.DirEntry]:
+    """Iterate over record files in the storage directory.
 
-        # Handle custom objects with __dict__
-        if hasattr(value, "__dict__"):
-            result = {
-                "__class__": type(value).__name__,
-                "__module__": type(value).__module__,
-            }
-            for key, val in value.__dict__.items():
-                result[key] = self._serialize_value(val, depth + 1, max_depth)
-            return result
+    Args:
+        storage_dir: Directory containing test records
 
-        # Fallback to string representation
-        return repr(value)
+    Yields:
+        Directory entries for record files
+    """
+    try:
+        with os.scandir(storage_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield entry
+    except FileNotFoundError:
+        return
 
-    def _serve_404(self) -> None:
-        """Serve 404 error."""
-        self.send_response(404)
-        self.send_header("Content-type", "text/html")
-        self.end_headers()
-        html = "<html><body><h1>404 Not Found</h1></body></html>"
-        self.wfile.write(html.encode("utf-8"))
 
-    def _serve_error(self, code: int, message: str) -> None:
-        """Serve error response."""
-        self.send_response(code)
-        self.send_header("Content-type", "application/json")
-        self.end_headers()
-        error = {"error": message}
-        self.wfile.write(json.dumps(error).encode("utf-8"))
+def _api_value(encoded: Any, decoded: Any) -> Any:
+    """Get the API representation of a stored value.
 
-    def _delete_record(self, record_id: str) -> None:
-        """Delete a single record."""
-        if not self.storage:
-            self._serve_error(500, "Storage not initialized")
+    Values stored as JSON are already serializable, so they are returned as
+    stored instead of being walked again.
+
+    Args:
+        encoded: Value as stored in the record file
+        decoded: Decoded value
+
+    Returns:
+        JSON-serializable value
+    """
+    if isinstance(encoded, dict) and encoded.get("type") == "json":
+        return encoded["data"]
+    return _serialize_value(decoded)
+
+
+def _purge_record_cache(record_id: Optional[str] = None) -> None:
+    """Drop records from the records API cache.
+
+    Args:
+        record_id: Record ID to drop. If None, drops all records.
+    """
+    with _record_cache_lock:
+        if record_id is None:
+            _record_cache.clear()
             return
 
+        suffix = f".{record_id}.json"
+        for path in [p for p in _record_cache if p.endswith(suffix)]:
+            del _record_cache[path]
+
+
+def _load_record_entry(entry: os.DirEntry) -> tuple[bool, dict[str, Any]]:
+    """Load a single record file for the records API.
+
+    Successfully loaded records are cached and reused while the file's
+    (mtime_ns, size) is unchanged. Errors are not cached, so a record whose
+    class has been restored loads again on the next request.
+
+    Args:
+        entry: Directory entry of the record file
+
+    Returns:
+        Tuple of (success, record or error information)
+    """
+    stem = entry.name[:-5]
+    # Record metadata for error reports; stays empty until the file is parsed
+    data: dict[str, Any] = {}
+    try:
+        stat = entry.stat()
+        cached = _record_cache.get(entry.path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return True, cached[2]
+
+        # Read the JSON file to get basic info. The json module is used rather
+        # than orjson, which parses integers wider than 64 bits as floats
+        with open(entry.path, "rb") as f:
+            parsed = json.loads(f.read())
+        if isinstance(parsed, dict):
+            data = parsed
+
+        # Try to load the full record
+        record = TestRecord.from_dict(parsed)
+
+        record_dict = {
+            "module": record.module,
+            "function": record.function,
+            "args": _api_value(data["args"], record.args),
+            "kwargs": _api_value(data["kwargs"], record.kwargs),
+            "result": _api_value(data["result"], record.result),
+            "timestamp": record.timestamp,
+            "record_id": record.record_id,
+        }
+
+        with _record_cache_lock:
+            if len(_record_cache) >= _RECORD_CACHE_SIZE:
+                # Evict the oldest entry
+                _record_cache.pop(next(iter(_record_cache)), None)
+            _record_cache[entry.path] = (stat.st_mtime_ns, stat.st_size, record_dict)
+
+        return True, record_dict
+
+    except AttributeError as e:
+        # Class not found error - extract useful information
+        error_msg = str(e)
+        match = _CLASS_NOT_FOUND_RE.search(error_msg)
+        class_name = match.group(1) if match else "Unknown"
+
+        return False, {
+            "record_id": data.get("record_id", stem),
+            "module": data.get("module", "unknown"),
+            "function": data.get("function", "unknown"),
+            "timestamp": data.get("timestamp", ""),
+            "error_type": "MissingClass",
+            "error_message": f"Class '{class_name}' not found in module",
+            "details": f"The class '{class_name}' has been deleted or renamed.",
+            "suggested_fixes": [
+                f"Restore the '{class_name}' class",
+                "Delete this record",
+                "Update all records with REGREST_UPDATE_MODE=1",
+            ],
+        }
+
+    except Exception as e:
+        # Generic error (data is empty if the file could not be parsed)
+        return False, {
+            "record_id": data.get("record_id", stem),
+            "module": data.get("module", "unknown"),
+            "function": data.get("function", "unknown"),
+            "timestamp": data.get("timestamp", ""),
+            "error_type": type(e).__name__,
+            "error_message": str(e)[:200],
+            "details": "Failed to load this record",
+            "suggested_fixes": [
+                "Delete this record",
+                "Check the record file for corruption",
+            ],
+        }
+
+
+def _iter_matching_record_files(
+    storage_dir: Path,
+    module: Optional[str] = None,
+    function: Optional[str] = None,
+) -> Iterator[os.DirEntry]:
+    """Iterate over record files, filtered by filename.
+
+    Args:
+        storage_dir: Directory containing test records
+        module: If given, only yield records of this module
+        function: If given, only yield records of this function
+
+    Yields:
+        Directory entries for matching record files
+    """
+    for entry in _iter_record_files(storage_dir):
+        if _entry_matches(entry.name, module, function):
+            yield entry
+
+
+def _load_record_entries(
+    entries: Iterable[os.DirEntry],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Load record files for the records API.
+
+    Args:
+        entries: Directory entries of the record files
+
+    Returns:
+        Tuple of (records, error records)
+    """
+    records_data = []
+    error_records = []
+
+    for entry in entries:
+        success, item = _load_record_entry(entry)
+        if success:
+            records_data.append(item)
+        else:
+            error_records.append(item)
+
+    return records_data, error_records
+
+
+def _load_records(
+    storage_dir: Path,
+    module: Optional[str] = None,
+    function: Optional[str] = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Load all matching record files for the records API.
+
+    Files are filtered by filename before they are opened.
+
+    Args:
+        storage_dir: Directory containing test records
+        module: If given, only load records of this module
+        function: If given, only load records of this function
+
+    Returns:
+        Tuple of (records, error records)
+    """
+    return _load_record_entries(
+        _iter_matching_record_files(storage_dir, module, function)
+    )
+
+
+def _entry_mtime(entry: os.DirEntry) -> int:
+    """Get the modification time of a directory entry (0 if it is gone)."""
+    try:
+        return entry.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _entry_matches(
+    filename: str, module: Optional[str], function: Optional[str]
+) -> bool:
+    """Check whether a record filename matches the module/function filters.
+
+    Args:
+        filename: Record filename (``<module>.<function>.<record_id>.json``)
+        module: Module name to match, or None to match any
+        function: Function name to match, or None to match any
+
+    Returns:
+        True if the filename matches
+    """
+    if module is None and function is None:
+        return True
+
+    # Module names may contain dots, so split from the right
+    parts = filename[:-5].rsplit(".", 2)
+    if len(parts) != 3:
+        return False
+    return (module is None or parts[0] == module) and (
+        function is None or parts[1] == function
+    )
+
+
+def _parse_count(params: Mapping[str, str], name: str) -> Optional[int]:
+    """Parse a non-negative integer query parameter.
+
+    Args:
+        params: Query parameters
+        name: Parameter name
+
+    Returns:
+        Parsed value, or None if the parameter is missing
+
+    Raises:
+        ValueError: If the value is not a non-negative integer
+    """
+    value = params.get(name)
+    if not value:
+        return None
+    if not value.isdecimal():
+        raise ValueError(f"{name} must be a non-negative integer")
+    return int(value)
+
+
+def _parse_records_query(
+    params: Mapping[str, str],
+) -> tuple[Optional[int], int, Optional[str], Optional[str]]:
+    """Parse the query parameters of the records API.
+
+    Args:
+        params: Query parameters
+
+    Returns:
+        Tuple of (limit, offset, module, function)
+
+    Raises:
+        ValueError: If limit or offset is not a non-negative integer
+    """
+    return (
+        _parse_count(params, "limit"),
+        _parse_count(params, "offset") or 0,
+        params.get("module") or None,
+        params.get("function") or None,
+    )
+
+
+def _wants_pretty(params: Mapping[str, str]) -> bool:
+    """Check whether indented JSON output was requested (e.g., ?pretty=1).
+
+    Args:
+        params: Query parameters
+
+    Returns:
+        True if the output should be indented
+    """
+    return params.get("pretty", "").lower() in ("true", "1", "yes", "on")
+
+
+def _build_records_payload(
+    storage_dir: Path,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    module: Optional[str] = None,
+    function: Optional[str] = None,
+) -> tuple[Union[dict[str, Any], list[dict[str, Any]]], int]:
+    """Build the records API response.
+
+    The total counts matching record files, including files that fail to
+    load. When paginating, the page is also taken over record files (newest
+    modified first).
+
+    Args:
+        storage_dir: Directory containing test records
+        limit: Maximum number of records to return (None for all)
+        offset: Number of records to skip
+        module: If given, only return records of this module
+        function: If given, only return records of this function
+
+    Returns:
+        Tuple of (response, total number of matching records)
+    """
+    if limit is None and not offset:
+        records_data, error_records = _load_records(storage_dir, module, function)
+        total = len(records_data) + len(error_records)
+    else:
+        # Page over files ordered by modification time (records are rewritten
+        # whenever their timestamp changes) so only the page is opened
+        entries = list(_iter_matching_record_files(storage_dir, module, function))
+        entries.sort(key=_entry_mtime, reverse=True)
+        total = len(entries)
+        end = None if limit is None else offset + limit
+        records_data, error_records = _load_record_entries(entries[offset:end])
+
+    # Sort by timestamp (newest first)
+    records_data.sort(key=lambda r: r["timestamp"], reverse=True)
+
+    response: Union[dict[str, Any], list[dict[str, Any]]] = {
+        "records": records_data,
+        "error_records": error_records,
+        "total_errors": len(error_records),
+    }
+
+    # For backward compatibility, return just the array if no errors
+    if len(error_records) == 0:
+        response = records_data
+
+    return response, total
+
+
+def _build_stats_payload(storage: Storage) -> dict[str, Any]:
+    """Build the stats API response.
+
+    Args:
+        storage: Storage instance
+
+    Returns:
+        Statistics of the stored records
+    """
+    # Counts come from the filenames, so no record needs to be loaded
+    counts = storage.count_by_function()
+
+    # Group by module and function
+    by_module: Counter[str] = Counter()
+    by_function: dict[str, int] = {}
+    for (module, function), count in counts.items():
+        by_module[module] += count
+        by_function[f"{module}.{function}"] = count
+
+    return {
+        "total_records": sum(counts.values()),
+        "total_modules": len(by_module),
+        "total_functions": len(by_function),
+        "by_module": dict(by_module),
+        "by_function": by_function,
+    }
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Check whether the client accepts gzip-encoded responses.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding header
+
+    Returns:
+        True if gzip is accepted
+    """
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            # "gzip;q=0" explicitly refuses gzip
+            _, _, quality = params.partition("q=")
+            try:
+                return not quality or float(quality) > 0
+            except ValueError:
+                return False
+    return False
+
+
+def _encode_body(body: bytes, headers: dict[str, str], use_gzip: bool) -> bytes:
+    """Compress an API response body if the client accepts it.
+
+    Args:
+        body: Encoded JSON
+        headers: Response headers (updated with the encoding headers)
+        use_gzip: If True, gzip bodies that are large enough
+
+    Returns:
+        Response body
+    """
+    headers["Vary"] = "Accept-Encoding"
+    if not use_gzip or len(body) < _GZIP_MIN_SIZE:
+        return body
+    headers["Content-Encoding"] = "gzip"
+    return gzip.compress(body, compresslevel=_GZIP_LEVEL)
+
+
+# API response: (HTTP status code, encoded JSON body, extra headers)
+_ApiResponse = tuple[int, bytes, dict[str, str]]
+
+
+def _api_error(status: int, message: str) -> _ApiResponse:
+    """Create an API error response.
+
+    Args:
+        status: HTTP status code
+        message: Error message
+
+    Returns:
+        API response
+    """
+    return status, _json.dumps({"error": message}), {}
+
+
+class _RecordsApi:
+    """JSON API shared by the Flask and standard library servers.
+
+    Each method returns the response as (status, body, headers), so both
+    servers only have to write it out.
+    """
+
+    def __init__(self, storage: Storage):
+        """Initialize the API.
+
+        Args:
+            storage: Storage instance
+        """
+        self.storage = storage
+        # Cache encoded responses between polls
+        self.response_cache = _ResponseCache()
+
+    def get_records(
+        self, params: Mapping[str, str], accept_encoding: Optional[str]
+    ) -> _ApiResponse:
+        """Get records.
+
+        Args:
+            params: Query parameters (limit, offset, module, function and pretty)
+            accept_encoding: Value of the Accept-Encoding header
+
+        Returns:
+            API response
+        """
+        try:
+            limit, offset, module, function = _parse_records_query(params)
+        except ValueError as e:
+            return _api_error(400, str(e))
+
+        try:
+            storage_dir = self.storage.config.storage_dir
+            use_gzip = _accepts_gzip(accept_encoding)
+            pretty = _wants_pretty(params)
+            cache_key = (
+                f"records:{limit}:{offset}:{module}:{function}:{use_gzip}:{pretty}"
+            )
+            cached, version = self.response_cache.get(cache_key, storage_dir)
+            if cached is not None:
+                return 200, *cached
+
+            response, total = _build_records_payload(
+                storage_dir, limit, offset, module, function
+            )
+            headers = {"X-Total-Count": str(total)}
+            body = _encode_body(_json.dumps(response, pretty), headers, use_gzip)
+            self.response_cache.put(cache_key, storage_dir, version, body, headers)
+            return 200, body, headers
+
+        except Exception as e:
+            return _api_error(500, f"Error loading records: {str(e)}")
+
+    def get_stats(
+        self, params: Mapping[str, str], accept_encoding: Optional[str]
+    ) -> _ApiResponse:
+        """Get statistics.
+
+        Args:
+            params: Query parameters (pretty)
+            accept_encoding: Value of the Accept-Encoding header
+
+        Returns:
+            API response
+        """
+        try:
+            storage_dir = self.storage.config.storage_dir
+            use_gzip = _accepts_gzip(accept_encoding)
+            pretty = _wants_pretty(params)
+            cache_key = f"stats:{use_gzip}:{pretty}"
+            cached, version = self.response_cache.get(cache_key, storage_dir)
+            if cached is not None:
+                return 200, *cached
+
+            stats = _build_stats_payload(self.storage)
+            headers: dict[str, str] = {}
+            body = _encode_body(_json.dumps(stats, pretty), headers, use_gzip)
+            self.response_cache.put(cache_key, storage_dir, version, body, headers)
+            return 200, body, headers
+
+        except Exception as e:
+            return _api_error(500, f"Error calculating stats: {str(e)}")
+
+    def delete_record(self, record_id: str) -> _ApiResponse:
+        """Delete a single record.
+
+        Args:
+            record_id: Record ID to delete
+
+        Returns:
+            API response
+        """
         try:
             success = self.storage.delete(record_id)
+            self.response_cache.clear()
+            _purge_record_cache(record_id)
 
-            if success:
-                self.send_response(200)
-                self.send_header("Content-type", "application/json")
-                self.send_header("Access-Control-Allow-Origin", "*")
-                self.end_headers()
-                result = {"success": True, "message": f"Deleted record {record_id}"}
-                self.wfile.write(json.dumps(result).encode("utf-8"))
-            else:
-                self._serve_error(404, f"Record {record_id} not found")
+            if not success:
+                return _api_error(404, f"Record {record_id} not found")
+
+            result = {"success": True, "message": f"Deleted record {record_id}"}
+            return 200, _json.dumps(result), {}
 
         except Exception as e:
-            self._serve_error(500, f"Error deleting record: {str(e)}")
+            return _api_error(500, f"Error deleting record: {str(e)}")
 
-    def _delete_all_records(self) -> None:
-        """Delete all records."""
-        if not self.storage:
-            self._serve_error(500, "Storage not initialized")
-            return
+    def delete_all_records(self) -> _ApiResponse:
+        """Delete all records.
 
+        Returns:
+            API response
+        """
         try:
             count = self.storage.clear_all()
+            self.response_cache.clear()
+            _purge_record_cache()
 
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.send_header("Access-Control-Allow-Origin", "*")
-            self.end_headers()
             result = {
                 "success": True,
                 "count": count,
                 "message": f"Deleted {count} records",
             }
-            self.wfile.write(json.dumps(result).encode("utf-8"))
+            return 200, _json.dumps(result), {}
 
         except Exception as e:
-            self._serve_error(500, f"Error deleting records: {str(e)}")
+            return _api_error(500, f"Error deleting records: {str(e)}")
 
-    def log_message(self, format: str, *args: Any) -> None:
-        """Override to customize logging."""
-        # Simple log format
-        print(f"[{self.log_date_time_string()}] {format % args}")
 
+def _flask_api_response(response: _ApiResponse) -> Any:
+    """Create a Flask response from an API response.
 
-# ============================================================================
-# Shared helper function
-# ============================================================================
+    Args:
+        response: API response
+
+    Returns:
+        Flask response
+    """
+    status, body, headers = response
+    return Response(body, status=status, headers=headers, mimetype="application/json")
+
+
+# Work item of _serialize_value: (value, depth, target container, target key)
+_SerializeItem = tuple[Any, int, Any, Any]
+_Serializer = Callable[[Any, int, int, list[_SerializeItem]], Any]
+
+# Types that are already JSON-serializable
+_PRIMITIVE_TYPES = frozenset({type(None), bool, int, float, str})
+
+
+def _schedule_children(
+    container: Any,
+    keys: Iterable[Any],
+    depth: int,
+    max_depth: int,
+    stack: list[_SerializeItem],
+) -> None:
+    """Schedule the children of a container that still need serializing.
+
+    Args:
+        container: Container holding the unserialized children
+        keys: Keys (or indices) of the children
+        depth: Depth of the container
+        max_depth: Maximum nesting depth
+        stack: Work stack
+    """
+    child_depth = depth + 1
+    if child_depth > max_depth:
+        # Every child is replaced with a placeholder
+        stack.extend((container[key], child_depth, container, key) for key in keys)
+        return
+
+    # Primitives are left in place
+    for key in keys:
+        if type(container[key]) not in _PRIMITIVE_TYPES:
+            stack.append((container[key], child_depth, container, key))
+
+
+def _serialize_sequence(
+    value: Any, depth: int, max_depth: int, stack: list[_SerializeItem]
+) -> list[Any]:
+    """Serialize a list or tuple."""
+    result = list(value)
+    _schedule_children(result, range(len(result)), depth, max_depth, stack)
+    return result
+
+
+def _serialize_mapping(
+    value: Any, depth: int, max_depth: int, stack: list[_SerializeItem]
+) -> dict[str, Any]:
+    """Serialize a dict, converting keys to strings."""
+    result = {str(k): v for k, v in value.items()}
+    _schedule_children(result, result.keys(), depth, max_depth, stack)
+    return result
+
+
+def _serialize_set(
+    value: Any, depth: int, max_depth: int, stack: list[_SerializeItem]
+) -> list[Any]:
+    """Serialize a set as a list."""
+    return list(value)
+
+
+def _serialize_object(
+    value: Any, depth: int, max_depth: int, stack: list[_SerializeItem]
+) -> dict[str, Any]:
+    """Serialize a custom object with __dict__."""
+    result = {
+        "__class__": type(value).__name__,
+        "__module__": type(value).__module__,
+    }
+    result.update(value.__dict__)
+    _schedule_children(result, value.__dict__.keys(), depth, max_depth, stack)
+    return result
+
+
+def _serialize_primitive(
+    value: Any, depth: int, max_depth: int, stack: list[_SerializeItem]
+) -> Any:
+    """Serialize a JSON-serializable primitive (returned as is)."""
+    return value
+
+
+def _serialize_repr(
+    value: Any, depth: int, max_depth: int, stack: list[_SerializeItem]
+) -> str:
+    """Serialize any other value as its string representation."""
+    return repr(value)
+
+
+# Serializers for exact types; subclasses are resolved by _find_serializer
+_SERIALIZERS: dict[type, _Serializer] = {
+    list: _serialize_sequence,
+    tuple: _serialize_sequence,
+    dict: _serialize_mapping,
+    set: _serialize_set,
+}
+
+
+def _find_serializer(value: Any) -> _Serializer:
+    """Find the serializer for a value whose exact type is not registered.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        Serializer function
+    """
+    if isinstance(value, (bool, int, float, str)):
+        return _serialize_primitive
+    if isinstance(value, (list, tuple)):
+        return _serialize_sequence
+    if isinstance(value, dict):
+        return _serialize_mapping
+    if isinstance(value, set):
+        return _serialize_set
+    if hasattr(value, "__dict__"):
+        return _serialize_object
+    return _serialize_repr
 
 
 def _serialize_value(value: Any, depth: int = 0, max_depth: int = 10) -> Any:
     """Serialize a value for JSON response.
 
+    Containers are walked with an explicit work stack instead of recursion.
+
     Args:
         value: Value to serialize
-        depth: Current recursion depth
-        max_depth: Maximum recursion depth
+        depth: Depth of the value
+        max_depth: Maximum nesting depth
 
     Returns:
         JSON-serializable value
     """
-    # Prevent infinite recursion
-    if depth > max_depth:
-        return f"<max depth reached: {type(value).__name__}>"
+    root = [value]
+    stack: list[_SerializeItem] = [(value, depth, root, 0)]
 
-    # Handle JSON-serializable primitives
-    if value is None or isinstance(value, (bool, int, float, str)):
-        return value
+    while stack:
+        value, depth, target, key = stack.pop()
 
-    # Handle lists and tuples
-    if isinstance(value, (list, tuple)):
-        return [_serialize_value(item, depth + 1, max_depth) for item in value]
-
-    # Handle dicts
-    if isinstance(value, dict):
-        return {
-            str(k): _serialize_value(v, depth + 1, max_depth) for k, v in value.items()
-        }
+        # Prevent infinite recursion on self-referencing values
+        if depth > max_depth:
+            target[key] = f"<max depth reached: {type(value).__name__}>"
+            continue
 
-    # Handle sets
-    if isinstance(value, set):
-        return list(value)
+        value_type = type(value)
+        if value_type in _PRIMITIVE_TYPES:
+            continue
 
-    # Handle custom objects with __dict__
-    if hasattr(value, "__dict__"):
-        result = {
-            "__class__": type(value).__name__,
-            "__module__": type(value).__module__,
-        }
-        for key, val in value.__dict__.items():
-            result[key] = _serialize_value(val, depth + 1, max_depth)
-        return result
+        serializer = _SERIALIZERS.get(value_type) or _find_serializer(value)
+        target[key] = serializer(value, depth, max_depth, stack)
 
-    # Fallback to string representation
-    return repr(value)
+    return root[0]
 
 
 # ============================================================================
@@ -662,31 +1145,60 @@ def _get_file_mtimes(watch_paths: list[Path]) -> dict[Path, float]:
     return mtimes
 
 
-def _run_server_with_reload(host: str, port: int, storage_dir: str) -> None:
-    """Run server with auto-reload on file changes.
+def _iter_changes(watch_paths: list[Path]) -> Iterator[list[str]]:
+    """Wait for changes to watched files.
+
+    Uses file system notifications via watchfiles if installed, and polls
+    modification times every second otherwise.
+
+    Args:
+        watch_paths: List of paths to watch
+
+    Yields:
+        Names of the changed files
+    """
+    if HAS_WATCHFILES:
+        for changes in watch(*watch_paths):
+            yield sorted({Path(path).name for _, path in changes})
+        return
+
+    # Get initial modification times
+    mtimes = _get_file_mtimes(watch_paths)
+
+    while True:
+        time.sleep(1)
+
+        # Check for file changes
+        current_mtimes = _get_file_mtimes(watch_paths)
+
+        if current_mtimes != mtimes:
+            # Find changed files
+            changed = []
+            for path in set(mtimes.keys()) | set(current_mtimes.keys()):
+                old_mtime = mtimes.get(path, 0)
+                new_mtime = current_mtimes.get(path, 0)
+                if old_mtime != new_mtime:
+                    changed.append(path.name)
+
+            yield changed
+            mtimes = current_mtimes
+
+
+def _start_server_process(
+    host: str, port: int, storage_dir: str
+) -> subprocess.Popen[bytes]:
+    """Start the server in a subprocess with reload disabled.
 
     Args:
         host: Host to bind to
         port: Port to bind to
         storage_dir: Directory containing test records
-    """
-    # Watch regrest package directory and static files
-    package_dir = Path(__file__).parent
-    static_dir = package_dir / "static"
-    watch_paths = [package_dir / "server.py", static_dir]
-
-    print("\n" + "=" * 60)
-    print("🧪 Regrest Visualization Server (Hot Reload Enabled)")
-    print("=" * 60)
-    print(f"\n📁 Storage directory: {storage_dir}")
-    print(f"🌐 Server running at: http://{host}:{port}")
-    print(f"👀 Watching: {package_dir / 'server.py'}, {static_dir}")
-    print("\n💡 Press Ctrl+C to stop the server\n")
-    print("=" * 60 + "\n")
 
-    # Start server in subprocess
+    Returns:
+        Server process
+    """
     # Note: --storage-dir is a global option, so it must come before 'serve'
-    process = subprocess.Popen(
+    return subprocess.Popen(
         [
             sys.executable,
             "-m",
@@ -702,50 +1214,40 @@ def _run_server_with_reload(host: str, port: int, storage_dir: str) -> None:
         env={**os.environ, "REGREST_NO_RELOAD": "1"},
     )
 
-    # Get initial modification times
-    mtimes = _get_file_mtimes(watch_paths)
+
+def _run_server_with_reload(host: str, port: int, storage_dir: str) -> None:
+    """Run server with auto-reload on file changes.
+
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+        storage_dir: Directory containing test records
+    """
+    # Watch regrest package directory and static files
+    package_dir = Path(__file__).parent
+    watch_paths = [package_dir / "server.py", _STATIC_DIR]
+
+    print("\n" + "=" * 60)
+    print("🧪 Regrest Visualization Server (Hot Reload Enabled)")
+    print("=" * 60)
+    print(f"\n📁 Storage directory: {storage_dir}")
+    print(f"🌐 Server running at: http://{host}:{port}")
+    print(f"👀 Watching: {package_dir / 'server.py'}, {_STATIC_DIR}")
+    print("\n💡 Press Ctrl+C to stop the server\n")
+    print("=" * 60 + "\n")
+
+    # Start server in subprocess
+    process = _start_server_process(host, port, storage_dir)
 
     try:
-        while True:
-            time.sleep(1)
-
-            # Check for file changes
-            current_mtimes = _get_file_mtimes(watch_paths)
-
-            if current_mtimes != mtimes:
-                # Find changed files
-                changed = []
-                for path in set(mtimes.keys()) | set(current_mtimes.keys()):
-                    old_mtime = mtimes.get(path, 0)
-                    new_mtime = current_mtimes.get(path, 0)
-                    if old_mtime != new_mtime:
-                        changed.append(path.name)
-
-                print(f"\n🔄 Detected changes in: {', '.join(changed)}")
-                print("♻️  Restarting server...\n")
-
-                # Kill old process
-                process.terminate()
-                process.wait(timeout=5)
-
-                # Start new process
-                process = subprocess.Popen(
-                    [
-                        sys.executable,
-                        "-m",
-                        "regrest",
-                        "--storage-dir",
-                        storage_dir,
-                        "serve",
-                        "--host",
-                        host,
-                        "--port",
-                        str(port),
-                    ],
-                    env={**os.environ, "REGREST_NO_RELOAD": "1"},
-                )
+        for changed in _iter_changes(watch_paths):
+            print(f"\n🔄 Detected changes in: {', '.join(changed)}")
+            print("♻️  Restarting server...\n")
 
-                mtimes = current_mtimes
+            # Kill old process and start a new one
+            process.terminate()
+            process.wait(timeout=5)
+            process = _start_server_process(host, port, storage_dir)
 
     except KeyboardInterrupt:
         print("\n\n🛑 Shutting down server...")
@@ -754,11 +1256,6 @@ def _run_server_with_reload(host: str, port: int, storage_dir: str) -> None:
         print("✅ Server stopped.\n")
 
 
-# ============================================================================
-# Main entry point
-# ============================================================================
-
-
 def run_server(
     host: str = "localhost",
     port: int = 8000,
@@ -777,8 +1274,15 @@ def run_server(
     if HAS_FLASK:
         app = _create_flask_app(storage_dir)
 
+        # Use waitress when available; the Werkzeug development server is
+        # only needed for its reloader
+        use_waitress = HAS_WAITRESS and not reload
+
         print("\n" + "=" * 60)
-        print("🧪 Regrest Visualization Server (Flask)")
+        if use_waitress:
+            print("🧪 Regrest Visualization Server (Flask + waitress)")
+        else:
+            print("🧪 Regrest Visualization Server (Flask)")
         print("=" * 60)
         print(f"\n📁 Storage directory: {storage_dir}")
         print(f"🌐 Server running at: http://{host}:{port}")
@@ -787,7 +1291,16 @@ def run_server(
         print("\n💡 Press Ctrl+C to stop the server\n")
         print("=" * 60 + "\n")
 
-        app.run(host=host, port=port, debug=reload)
+        if use_waitress:
+            waitress_serve(app, host=host, port=port, threads=8, channel_timeout=30)
+        else:
+            # Reload without debug mode; the debugger slows every request
+            app.run(
+                host=host,
+                port=port,
+                use_reloader=reload,
+                extra_files=[str(path) for path in _STATIC_DIR.iterdir()],
+            )
 
     else:
         # Fall back to standard library server
@@ -804,7 +1317,7 @@ def run_server(
 
         # Create storage instance
         storage = Storage()
-        RecordHandler.storage = storage
+        RecordHandler.api = _RecordsApi(storage)
 
         # Create and start server
         server = HTTPServer((host, port), RecordHandler)
@@ -7,13 +7,74 @@ import importlib
 import io
 import json
 import logging
+import os
 import pickle
+import re
 import sys
+import threading
+import zlib
+from collections.abc import Iterator
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Optional
 
 from .config import get_config
 
+# Pickle protocol 5 is the highest protocol readable by every supported Python
+# version (3.8+), so records stay portable across interpreters
+_PICKLE_PROTOCOL = 5
+
+# Pickled payloads at least this many bytes are stored zlib-compressed. Level 1
+# is the fastest level and already shrinks typical pickles several times.
+_COMPRESS_THRESHOLD = 1024
+_COMPRESS_LEVEL = 1
+
+# Storage.find keeps up to this many decoded records, and only records whose
+# file is at most _FIND_CACHE_MAX_FILE_SIZE bytes, so that the cache stays small
+# inside the user's process
+_FIND_CACHE_SIZE = 256
+_FIND_CACHE_MAX_FILE_SIZE = 4096
+
+
+def _read_record_file(filepath: Path) -> dict[str, Any]:
+    """Read and parse a record file.
+
+    The file is read as bytes in a single call and parsed directly, skipping
+    the text-mode decoding layer.
+
+    Args:
+        filepath: Path to the record file
+
+    Returns:
+        Parsed record data
+
+    Raises:
+        FileNotFoundError: If the record file does not exist
+    """
+    with open(filepath, "rb") as f:
+        return json.loads(f.read())
+
+
+def _is_cacheable(data: dict[str, Any], size: int) -> bool:
+    """Check whether a record is small enough to keep in the find cache.
+
+    The file size bounds the decoded size, except for compressed pickles, which
+    can expand many times over, so records holding one are never cached.
+
+    Args:
+        data: Parsed record data
+        size: Size of the record file in bytes
+
+    Returns:
+        True if the decoded record may be cached
+    """
+    if size > _FIND_CACHE_MAX_FILE_SIZE:
+        return False
+    return not any(
+        isinstance(data.get(key), dict) and data[key].get("type") == "pickle_zlib"
+        for key in ("args", "kwargs", "result")
+    )
+
 
 class ModuleRemappingUnpickler(pickle.Unpickler):
     """Custom unpickler that remaps __main__ to actual module names."""
@@ -96,6 +157,16 @@ class ModuleRemappingUnpickler(pickle.Unpickler):
 class TestRecord:
     """Represents a test record."""
 
+    __slots__ = (
+        "module",
+        "function",
+        "args",
+        "kwargs",
+        "result",
+        "timestamp",
+        "record_id",
+    )
+
     def __init__(
         self,
         module: str,
@@ -127,18 +198,47 @@ class TestRecord:
 
     def _generate_id(self) -> str:
         """Generate a unique ID based on module, function, and arguments."""
+        return self.compute_id(self.module, self.function, self.args, self.kwargs)
+
+    @staticmethod
+    def compute_id(module: str, function: str, args: tuple, kwargs: dict) -> str:
+        """Compute the record ID for a function call.
+
+        Args:
+            module: Module name where the function is defined
+            function: Function name
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            Record ID
+        """
         # Serialize args and kwargs for hashing
         try:
-            args_str = json.dumps(self.args, sort_keys=True, default=str)
-            kwargs_str = json.dumps(self.kwargs, sort_keys=True, default=str)
+            args_str = json.dumps(args, sort_keys=True, default=str)
+            kwargs_str = json.dumps(kwargs, sort_keys=True, default=str)
         except (TypeError, ValueError):
             # Fallback to repr if JSON serialization fails
-            args_str = repr(self.args)
-            kwargs_str = repr(self.kwargs)
+            args_str = repr(args)
+            kwargs_str = repr(kwargs)
 
-        data = f"{self.module}.{self.function}:{args_str}:{kwargs_str}"
+        data = f"{module}.{function}:{args_str}:{kwargs_str}"
         return hashlib.sha256(data.encode()).hexdigest()[:16]
 
+    @staticmethod
+    def make_filename(module: str, function: str, record_id: str) -> str:
+        """Build the record filename.
+
+        Args:
+            module: Module name where the function is defined
+            function: Function name
+            record_id: Record ID
+
+        Returns:
+            Filename of the record
+        """
+        return f"{module}.{function}.{record_id}.json"
+
     def _try_encode(self, value: Any) -> dict[str, Any]:
         """Try to encode value for JSON, fallback to pickle.
 
@@ -154,7 +254,15 @@ class TestRecord:
             return {"type": "json", "data": value}
         except (TypeError, ValueError):
             # Fallback to pickle
-            pickled = pickle.dumps(value)
+            pickled = pickle.dumps(value, protocol=_PICKLE_PROTOCOL)
+
+            # Compress large payloads; small ones are not worth the overhead
+            if len(pickled) >= _COMPRESS_THRESHOLD:
+                compressed = zlib.compress(pickled, _COMPRESS_LEVEL)
+                if len(compressed) < len(pickled):
+                    encoded = base64.b64encode(compressed).decode("ascii")
+                    return {"type": "pickle_zlib", "data": encoded}
+
             encoded = base64.b64encode(pickled).decode("ascii")
             return {"type": "pickle", "data": encoded}
 
@@ -170,8 +278,10 @@ class TestRecord:
             Decoded value
         """
         if isinstance(encoded, dict) and "type" in encoded:
-            if encoded["type"] == "pickle":
+            if encoded["type"] in ("pickle", "pickle_zlib"):
                 decoded = base64.b64decode(encoded["data"])
+                if encoded["type"] == "pickle_zlib":
+                    decoded = zlib.decompress(decoded)
                 # Use custom unpickler to remap __main__ to actual module
                 unpickler = ModuleRemappingUnpickler(io.BytesIO(decoded), module_name)
                 return unpickler.load()
@@ -216,7 +326,7 @@ class TestRecord:
 
     def get_filename(self) -> str:
         """Get the filename for this record."""
-        return f"{self.module}.{self.function}.{self.record_id}.json"
+        return self.make_filename(self.module, self.function, self.record_id)
 
 
 class Storage:
@@ -227,15 +337,48 @@ class Storage:
         self.config = get_config()
         self.config.ensure_storage_dir()
 
-    def save(self, record: TestRecord) -> None:
+        # Decoded records returned by find, keyed by filename and validated
+        # against the file's (mtime_ns, size) so external changes are seen
+        self._find_cache: dict[str, tuple[int, int, TestRecord]] = {}
+        # A Storage is shared by every thread calling a decorated function
+        self._find_cache_lock = threading.Lock()
+
+    def save(self, record: TestRecord) -> bool:
         """Save a test record.
 
+        If the record file already holds the same record (ignoring the
+        timestamp), it is left untouched.
+
         Args:
             record: Test record to save
+
+        Returns:
+            True if the record was written, False if it was unchanged
         """
+        # Storage instances are long-lived, so the directory may have been
+        # removed since initialization
+        self.config.ensure_storage_dir()
         filepath = self.config.storage_dir / record.get_filename()
+        content = json.dumps(record.to_dict(), indent=2)
+
+        try:
+            existing = _read_record_file(filepath)
+        except (FileNotFoundError, ValueError):
+            # No record yet, or a corrupted one that should be overwritten
+            existing = None
+
+        if existing is not None:
+            new = json.loads(content)
+            new["timestamp"] = existing.get("timestamp")
+            if new == existing:
+                return False
+
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(record.to_dict(), f, indent=2)
+            f.write(content)
+        # The rewrite may not change mtime or size, so drop any cached copy
+        with self._find_cache_lock:
+            self._find_cache.pop(filepath.name, None)
+        return True
 
     def load(self, record_id: str) -> Optional[TestRecord]:
         """Load a test record by ID.
@@ -253,9 +396,7 @@ class Storage:
         if not files:
             return None
 
-        with open(files[0], encoding="utf-8") as f:
-            data = json.load(f)
-            return TestRecord.from_dict(data)
+        return TestRecord.from_dict(_read_record_file(files[0]))
 
     def find(
         self, module: str, function: str, args: tuple, kwargs: dict
@@ -271,9 +412,40 @@ class Storage:
         Returns:
             TestRecord if found, None otherwise
         """
-        # Create a temporary record to get the ID
-        temp_record = TestRecord(module, function, args, kwargs, None)
-        return self.load(temp_record.record_id)
+        # The filename is fully determined by the call, so look it up directly
+        # instead of scanning the storage directory
+        record_id = TestRecord.compute_id(module, function, args, kwargs)
+        filepath = self.config.storage_dir / TestRecord.make_filename(
+            module, function, record_id
+        )
+
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            return None
+
+        # Reuse the decoded record if the file has not changed since last read
+        with self._find_cache_lock:
+            cached = self._find_cache.get(filepath.name)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        try:
+            data = _read_record_file(filepath)
+        except FileNotFoundError:
+            return None
+
+        record = TestRecord.from_dict(data)
+
+        if _is_cacheable(data, stat.st_size):
+            entry = (stat.st_mtime_ns, stat.st_size, record)
+            with self._find_cache_lock:
+                if len(self._find_cache) >= _FIND_CACHE_SIZE:
+                    # Evict the oldest entry
+                    self._find_cache.pop(next(iter(self._find_cache)), None)
+                self._find_cache[filepath.name] = entry
+
+        return record
 
     def list_all(self) -> list[TestRecord]:
         """List all test records.
@@ -281,17 +453,81 @@ class Storage:
         Returns:
             List of all test records
         """
-        records = []
-        for filepath in self.config.storage_dir.glob("*.json"):
-            try:
-                with open(filepath, encoding="utf-8") as f:
-                    data = json.load(f)
-                    records.append(TestRecord.from_dict(data))
-            except Exception as e:
-                # Skip invalid files or files with unpickleable data
-                logging.warning(f"Skipping record {filepath.name}: {str(e)}")
-                continue
-        return records
+        return list(self.iter_all())
+
+    def iter_all(self, keyword: Optional[str] = None) -> Iterator[TestRecord]:
+        """Iterate over test records, loading them one at a time.
+
+        Args:
+            keyword: If given, only yield records whose module or function
+                name contains it (case-insensitive)
+
+        Yields:
+            Test records
+        """
+        search = None
+        if keyword:
+            search = re.compile(re.escape(keyword), re.IGNORECASE).search
+
+        try:
+            entries = os.scandir(self.config.storage_dir)
+        except FileNotFoundError:
+            return
+
+        with entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                    continue
+
+                # Filenames contain the module and function names, so files
+                # that cannot match the keyword are skipped without loading
+                if search is not None and search(entry.name) is None:
+                    continue
+
+                try:
+                    record = TestRecord.from_dict(_read_record_file(Path(entry.path)))
+                except Exception as e:
+                    # Skip invalid files or files with unpickleable data
+                    logging.warning(f"Skipping record {entry.name}: {str(e)}")
+                    continue
+
+                if search is not None and not (
+                    search(record.module) or search(record.function)
+                ):
+                    continue
+
+                yield record
+
+    def count_by_function(self) -> dict[tuple[str, str], int]:
+        """Count test records per function without loading them.
+
+        Counts are taken from the record filenames, so records whose data
+        cannot be loaded are counted as well.
+
+        Returns:
+            Dict mapping (module, function) to the number of records
+        """
+        counts: dict[tuple[str, str], int] = {}
+
+        try:
+            entries = os.scandir(self.config.storage_dir)
+        except FileNotFoundError:
+            return counts
+
+        with entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                    continue
+
+                # <module>.<function>.<record_id>.json; the module may contain dots
+                parts = entry.name[:-5].rsplit(".", 2)
+                if len(parts) != 3:
+                    continue
+
+                key = (parts[0], parts[1])
+                counts[key] = counts.get(key, 0) + 1
+
+        return counts
 
     def delete(self, record_id: str) -> bool:
         """Delete a test record by ID.
@@ -0,0 +1,59 @@
+"""Test the regrest decorator."""
+
+import pytest
+
+from regrest import Config, get_config, regrest, set_config
+
+
+@pytest.fixture
+def storage_dir(tmp_path):
+    """Use a temporary storage directory for the test."""
+    original_config = get_config()
+    storage_dir = tmp_path / ".regrest"
+    set_config(Config(storage_dir=str(storage_dir)))
+    yield storage_dir
+    set_config(original_config)
+
+
+def test_records_on_first_call(storage_dir):
+    """Test that the first call records the result."""
+
+    @regrest
+    def double(x):
+        return x * 2
+
+    assert double(21) == 42
+    assert len(list(storage_dir.glob("*.json"))) == 1
+
+
+def test_disabled_returns_function_undecorated(storage_dir):
+    """Test that disabling regrest leaves the function untouched."""
+    set_config(Config(storage_dir=str(storage_dir), disabled=True))
+
+    def double(x):
+        return x * 2
+
+    assert regrest(double) is double
+    assert regrest(tolerance=0.1)(double) is double
+
+    assert double(21) == 42
+    assert not storage_dir.exists()
+
+
+def test_storage_instances_are_not_kept_for_every_directory(tmp_path):
+    """Test that storages of previously used directories are released."""
+    from regrest.decorator import _get_storage
+
+    @regrest
+    def double(x):
+        return x * 2
+
+    original_config = get_config()
+    try:
+        for i in range(10):
+            set_config(Config(storage_dir=str(tmp_path / f"regrest{i}")))
+            assert double(i) == i * 2
+    finally:
+        set_config(original_config)
+
+    assert _get_storage.cache_info().currsize < 10
@@ -0,0 +1,25 @@
+"""Test comparison of test results."""
+
+import math
+
+from regrest import Matcher
+
+
+def test_identical_and_equal_values_match():
+    """Test that identical objects and equal scalars match."""
+    matcher = Matcher(tolerance=1e-9)
+    data = {"values": [1, 2.5, "a"]}
+
+    assert matcher.match(data, data)
+    assert matcher.match(15, 15)
+    assert matcher.match(0.1 + 0.2, 0.3)
+    assert matcher.match(math.nan, math.nan)
+
+
+def test_nested_type_mismatch_is_detected():
+    """Test that equal containers with different element types do not match."""
+    matcher = Matcher(tolerance=1e-9)
+
+    result = matcher.match([1, 2], [1, 2.0])
+    assert not result
+    assert result.message == "Type mismatch at [1]: expected int, got float"
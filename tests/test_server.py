@@ -0,0 +1,262 @@
+"""Test the web server API."""
+
+import gzip
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+from http.server import HTTPServer
+
+import pytest
+
+from regrest import Config, get_config, regrest, set_config
+from regrest.server import (
+    RecordHandler,
+    _build_records_payload,
+    _load_records,
+    _RecordsApi,
+    _serialize_value,
+)
+from regrest.storage import Storage
+
+
+@pytest.fixture
+def storage_dir(tmp_path):
+    """Create a storage directory with a few records."""
+    original_config = get_config()
+    storage_dir = tmp_path / ".regrest"
+    set_config(Config(storage_dir=str(storage_dir)))
+
+    @regrest
+    def add(x, y):
+        return x + y
+
+    add(1, 2)
+    add(3, 4)
+
+    yield storage_dir
+    set_config(original_config)
+
+
+@pytest.fixture
+def base_url(storage_dir):
+    """Start the standard library server in a background thread."""
+    RecordHandler.api = _RecordsApi(Storage())
+    server = HTTPServer(("localhost", 0), RecordHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url):
+    with urllib.request.urlopen(url) as response:
+        return response.status, dict(response.headers), response.read()
+
+
+def test_stdlib_records_api(base_url):
+    """Test that the records API returns all records as JSON."""
+    status, headers, body = _get(f"{base_url}/api/records")
+
+    assert status == 200
+    assert headers["Content-type"] == "application/json"
+    assert int(headers["Content-Length"]) == len(body)
+    records = json.loads(body)
+    assert sorted(r["result"] for r in records) == [3, 7]
+    assert sorted(r["args"] for r in records) == [[1, 2], [3, 4]]
+
+
+def test_stdlib_records_api_pagination(storage_dir, base_url):
+    """Test paginating and filtering the records API."""
+
+    @regrest
+    def sub(x, y):
+        return x - y
+
+    sub(9, 1)
+
+    status, headers, body = _get(f"{base_url}/api/records?limit=2&offset=1")
+    assert status == 200
+    assert headers["X-Total-Count"] == "3"
+    assert len(json.loads(body)) == 2
+
+    _, headers, body = _get(f"{base_url}/api/records?function=sub")
+    assert headers["X-Total-Count"] == "1"
+    assert [r["result"] for r in json.loads(body)] == [8]
+
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        _get(f"{base_url}/api/records?limit=-1")
+    assert exc_info.value.code == 400
+
+
+def test_stdlib_records_api_gzip(storage_dir, base_url, monkeypatch):
+    """Test that the records API is gzip-compressed when accepted."""
+    monkeypatch.setattr("regrest.server._GZIP_MIN_SIZE", 0)
+
+    request = urllib.request.Request(
+        f"{base_url}/api/records", headers={"Accept-Encoding": "gzip"}
+    )
+    with urllib.request.urlopen(request) as response:
+        assert response.headers["Content-Encoding"] == "gzip"
+        records = json.loads(gzip.decompress(response.read()))
+
+    assert sorted(r["result"] for r in records) == [3, 7]
+
+
+def test_stdlib_stats_api(base_url):
+    """Test that the stats API counts records."""
+    _, _, body = _get(f"{base_url}/api/stats")
+
+    stats = json.loads(body)
+    assert stats["total_records"] == 2
+    assert stats["total_functions"] == 1
+
+    _, _, pretty_body = _get(f"{base_url}/api/stats?pretty=1")
+    assert b"\n" not in body
+    assert json.loads(pretty_body) == stats
+    assert pretty_body.startswith(b'{\n  "total_records"')
+
+
+def test_stdlib_static_file_revalidation(base_url):
+    """Test that static files can be revalidated with their ETag."""
+    status, headers, body = _get(base_url)
+    assert status == 200
+    assert headers["Content-type"] == "text/html; charset=utf-8"
+    assert int(headers["Content-Length"]) == len(body)
+
+    request = urllib.request.Request(
+        base_url, headers={"If-None-Match": headers["ETag"]}
+    )
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        urllib.request.urlopen(request)
+    assert exc_info.value.code == 304
+
+
+def test_stdlib_cached_records_refresh_on_change(base_url):
+    """Test that cached responses are dropped when records change."""
+    _get(f"{base_url}/api/records")
+
+    @regrest
+    def add(x, y):
+        return x + y
+
+    add(5, 6)
+
+    _, _, body = _get(f"{base_url}/api/records")
+    assert sorted(r["result"] for r in json.loads(body)) == [3, 7, 11]
+
+    request = urllib.request.Request(f"{base_url}/api/records", method="DELETE")
+    urllib.request.urlopen(request).close()
+
+    _, _, body = _get(f"{base_url}/api/records")
+    assert json.loads(body) == []
+
+
+def test_flask_records_api(storage_dir):
+    """Test that the Flask records API matches the standard library server."""
+    pytest.importorskip("flask")
+    from regrest.server import _create_flask_app
+
+    client = _create_flask_app(str(storage_dir)).test_client()
+    response = client.get("/api/records")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert sorted(r["result"] for r in response.get_json()) == [3, 7]
+
+
+def test_stdlib_records_api_reports_corrupt_file(storage_dir, base_url):
+    """Test that unreadable record files are reported as error records."""
+    (storage_dir / "mod.func.0123456789abcdef.json").write_text("{not json")
+    (storage_dir / "mod.func.fedcba9876543210.json").write_text("[]")
+
+    _, _, body = _get(f"{base_url}/api/records")
+
+    response = json.loads(body)
+    assert len(response["records"]) == 2
+    assert response["total_errors"] == 2
+    errors = sorted(response["error_records"], key=lambda e: e["record_id"])
+    assert errors[0]["record_id"] == "mod.func.0123456789abcdef"
+    assert errors[0]["error_type"] == "JSONDecodeError"
+    assert errors[1]["record_id"] == "mod.func.fedcba9876543210"
+    assert errors[1]["module"] == "unknown"
+
+
+def test_stdlib_records_api_total_counts_error_files(storage_dir, base_url):
+    """Test that X-Total-Count includes broken files with or without paging."""
+    (storage_dir / "mod.func.0123456789abcdef.json").write_text("{not json")
+
+    _, headers, _ = _get(f"{base_url}/api/records")
+    assert headers["X-Total-Count"] == "3"
+
+    _, headers, _ = _get(f"{base_url}/api/records?limit=10")
+    assert headers["X-Total-Count"] == "3"
+
+
+def test_load_records_reuses_unchanged_files(storage_dir, monkeypatch):
+    """Test that unchanged record files are not parsed again."""
+    records, _ = _load_records(storage_dir)
+    assert len(records) == 2
+
+    def fail(data):
+        raise AssertionError("record was parsed again")
+
+    monkeypatch.setattr("regrest.server.TestRecord.from_dict", fail)
+    assert _load_records(storage_dir)[0] == records
+
+    # A rewritten file is parsed again
+    filepath = next(storage_dir.glob("*.json"))
+    filepath.write_text(filepath.read_text() + "\n")
+    records, error_records = _load_records(storage_dir)
+    assert len(records) == 1
+    assert error_records[0]["error_type"] == "AssertionError"
+
+
+def test_stdlib_records_api_keeps_large_integers(base_url):
+    """Test that integers wider than 64 bits are returned exactly."""
+
+    @regrest
+    def big(x):
+        return 2**70 + x
+
+    big(1)
+
+    _, _, body = _get(f"{base_url}/api/records?function=big")
+
+    assert b"1180591620717411303425" in body
+    assert json.loads(body)[0]["result"] == 2**70 + 1
+
+
+def test_build_records_payload_pages_by_mtime(storage_dir):
+    """Test that a page only loads the most recently modified files."""
+    (storage_dir / "mod.func.0123456789abcdef.json").write_text("{not json")
+    for i, filepath in enumerate(sorted(storage_dir.glob("*.json"))):
+        os.utime(filepath, ns=(i, i))
+    newest = max(storage_dir.glob("*.json"), key=lambda p: p.stat().st_mtime_ns)
+
+    response, total = _build_records_payload(storage_dir, limit=1)
+
+    assert total == 3
+    assert len(response) == 1
+    assert newest.name == f"{response[0]['module']}.add.{response[0]['record_id']}.json"
+
+
+def test_serialize_value():
+    """Test serializing nested and custom values for the API."""
+
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = (y,)
+
+    cyclic = []
+    cyclic.append(cyclic)
+
+    assert _serialize_value({1: [Point(1, 2)], "s": {3}}) == {
+        "1": [{"__class__": "Point", "__module__": __name__, "x": 1, "y": [2]}],
+        "s": [3],
+    }
+    assert _serialize_value(cyclic, max_depth=1) == [["<max depth reached: list>"]]
+    assert _serialize_value(b"raw") == "b'raw'"
@@ -0,0 +1,105 @@
+"""Test storage of test records."""
+
+import pytest
+
+from regrest import Config, Storage, get_config, set_config
+from regrest import TestRecord as Record
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create a storage backed by a temporary directory."""
+    original_config = get_config()
+    set_config(Config(storage_dir=str(tmp_path / ".regrest")))
+    yield Storage()
+    set_config(original_config)
+
+
+def test_find_saved_record(storage):
+    """Test that a saved record is found by its call signature."""
+    record = Record("mymodule", "add", (1, 2), {"z": 3}, 6)
+    storage.save(record)
+
+    found = storage.find("mymodule", "add", (1, 2), {"z": 3})
+    assert found is not None
+    assert found.record_id == record.record_id
+    assert found.result == 6
+
+
+def test_find_missing_record(storage):
+    """Test that find returns None when no record matches."""
+    storage.save(Record("mymodule", "add", (1, 2), {}, 3))
+
+    assert storage.find("mymodule", "add", (2, 1), {}) is None
+    assert storage.find("mymodule", "sub", (1, 2), {}) is None
+
+
+def test_save_skips_unchanged_record(storage):
+    """Test that saving an identical record does not rewrite the file."""
+    record = Record("mymodule", "add", (1, 2), {}, 3, timestamp="2025-01-01T00:00:00")
+    assert storage.save(record)
+
+    same = Record("mymodule", "add", (1, 2), {}, 3, timestamp="2025-06-01T00:00:00")
+    assert not storage.save(same)
+    assert storage.find("mymodule", "add", (1, 2), {}).timestamp == record.timestamp
+
+    changed = Record("mymodule", "add", (1, 2), {}, 4)
+    assert storage.save(changed)
+    assert storage.find("mymodule", "add", (1, 2), {}).result == 4
+
+
+def test_large_pickled_result_is_compressed(storage):
+    """Test that large pickled payloads are compressed and round-trip."""
+    result = {(i, i + 1) for i in range(1000)}
+    record = Record("mymodule", "pairs", (), {}, result)
+    assert record.to_dict()["result"]["type"] == "pickle_zlib"
+
+    storage.save(record)
+    assert storage.find("mymodule", "pairs", (), {}).result == result
+
+
+def test_iter_all_filters_by_keyword(storage):
+    """Test that iter_all only yields records matching the keyword."""
+    storage.save(Record("app.math", "add", (1, 2), {}, 3))
+    storage.save(Record("app.math", "sub", (1, 2), {}, -1))
+    storage.save(Record("app.text", "upper", ("a",), {}, "A"))
+
+    assert len(storage.list_all()) == 3
+    assert {r.function for r in storage.iter_all(keyword="MATH")} == {"add", "sub"}
+    assert [r.function for r in storage.iter_all(keyword="upp")] == ["upper"]
+    assert list(storage.iter_all(keyword="app.math.add")) == []
+
+
+def test_find_reuses_decoded_record_until_file_changes(storage):
+    """Test that find caches decoded records and notices file changes."""
+    storage.save(Record("mymodule", "add", (1, 2), {}, 3))
+
+    first = storage.find("mymodule", "add", (1, 2), {})
+    assert storage.find("mymodule", "add", (1, 2), {}) is first
+
+    storage.save(Record("mymodule", "add", (1, 2), {}, 30))
+    assert storage.find("mymodule", "add", (1, 2), {}).result == 30
+
+
+def test_find_does_not_cache_large_records(storage):
+    """Test that find does not keep large or compressed records in memory."""
+    storage.save(Record("mymodule", "numbers", (), {}, list(range(10000))))
+    storage.save(Record("mymodule", "pairs", (), {}, {(i, i) for i in range(1000)}))
+
+    first = storage.find("mymodule", "numbers", (), {})
+    assert first.result == list(range(10000))
+    assert storage.find("mymodule", "numbers", (), {}) is not first
+    assert storage.find("mymodule", "pairs", (), {}) is not None
+    assert storage._find_cache == {}
+
+
+def test_count_by_function(storage):
+    """Test counting records per function from their filenames."""
+    storage.save(Record("app.math", "add", (1, 2), {}, 3))
+    storage.save(Record("app.math", "add", (2, 3), {}, 5))
+    storage.save(Record("app.text", "upper", ("a",), {}, "A"))
+
+    assert storage.count_by_function() == {
+        ("app.math", "add"): 2,
+        ("app.text", "upper"): 1,
+    }